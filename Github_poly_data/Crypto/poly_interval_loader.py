@@ -28,7 +28,7 @@ from logging.handlers import RotatingFileHandler
 # DB imports
 import psycopg2
 from psycopg2 import sql, extras
-from utilities.db_utils import get_connection, release_connection
+from utilities.db_utils import get_connection, release_connection, get_thread_connection
 
 # ───── 通用配置 ─────────────────────────
 GAMMA_API = "https://gamma-api.polymarket.com/events"
@@ -120,7 +120,7 @@ def ensure_dynamic_table(table_name: str):
 
 def insert_rows(table_name: str, rows: List[Tuple]):
     if not rows: return
-    conn = get_connection()
+    conn = get_thread_connection()
     try:
         with conn.cursor() as cur:
             extras.execute_values(
@@ -135,9 +135,8 @@ def insert_rows(table_name: str, rows: List[Tuple]):
         conn.commit()
     except psycopg2.Error as e:
         logging.error("DB insert error for table %s: %s", table_name, e)
-        conn.rollback()
-    finally:
-        release_connection(conn)
+        if not conn.closed:
+            conn.rollback()
 
 
 def fetch_event_details(slug: str) -> Optional[Dict]:
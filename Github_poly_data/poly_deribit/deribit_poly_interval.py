@@ -16,7 +16,7 @@ from typing import Dict, List, Optional, Tuple
 
 import requests
 from psycopg2 import sql
-from utilities.db_utils import get_connection, release_connection
+from utilities.db_utils import get_connection, release_connection, get_thread_connection
 
 # ───────────────── Logger ─────────────────
 def make_logger(name: str) -> logging.Logger:
@@ -33,6 +33,7 @@ def make_logger(name: str) -> logging.Logger:
 
 # ─────────────── Const ────────────────────
 GAMMA_API   = "https://gamma-api.polymarket.com/events"
+GAMMA_MARKETS_API = "https://gamma-api.polymarket.com/markets"
 SAMPLE_SECS = 60
 SCHEMA      = "polymarket_only"
 TABLE_NAME  = "pm_intervals"
@@ -44,6 +45,9 @@ SUFFIX   = {"":1, "K":1_000, "M":1_000_000, "B":1_000_000_000}
 # 砍掉 “… on July 25”“on Aug 1”
 CUT_DATE_RE = re.compile(r"\s+on\s+\w+\s+\d{1,2}", flags=re.I)
 
+# 不含数字的标签（Yes / No / Will X happen）直接跳过正则解析
+_HAS_DIGIT = re.compile(r"\d")
+
 COLS = ("ts_utc,slug,mk_id,label,lo_bound,hi_bound,pm_expiry,"
         "yes_bid,yes_ask,no_bid,no_ask")
 
@@ -84,6 +88,8 @@ def extract_numbers(label: str) -> List[float]:
     return out
 
 def parse_interval(label: str) -> Tuple[Optional[float], Optional[float]]:
+    if _HAS_DIGIT.search(label) is None:
+        return (None, None)
     label = CUT_DATE_RE.split(label,1)[0]          # 去掉日期尾巴
     ltxt  = label.lower()
     nums  = extract_numbers(label)
@@ -97,7 +103,8 @@ def parse_interval(label: str) -> Tuple[Optional[float], Optional[float]]:
         return (lo, hi)
     return (nums[0], nums[0]) if nums else (None, None)
 
-def get_event(slug: str) -> Optional[dict]:
+def get_event_full(slug: str) -> Optional[dict]:
+    """一次性拉取事件 + 全部 markets（标签、区间、到期日）"""
     try:
         r = requests.get(GAMMA_API, params={"slug": slug, "archived": False, "includeMarkets":"true"}, timeout=8)
         if r.ok and r.json():
@@ -106,6 +113,20 @@ def get_event(slug: str) -> Optional[dict]:
         logging.warning("Polymarket API error %s", e)
     return None
 
+def get_prices(market_ids: List) -> Optional[Dict]:
+    """
+    只拉指定 markets 的盘口：{market_id: (bestBid, bestAsk)}。
+    不再每分钟下载整个事件（描述、tags、outcomes 等）。
+    """
+    params = [("id", i) for i in market_ids] + [("limit", len(market_ids))]
+    try:
+        r = requests.get(GAMMA_MARKETS_API, params=params, timeout=8)
+        if r.ok:
+            return {m["id"]: (m.get("bestBid"), m.get("bestAsk")) for m in r.json()}
+    except Exception as e:
+        logging.warning("Polymarket API error %s", e)
+    return None
+
 # ─────────────── DB ────────────────────────
 def ensure_table():
     conn = get_connection()
@@ -117,28 +138,24 @@ def ensure_table():
 def insert_rows(rows: List[Tuple]):
     if not rows:
         return
-    conn = get_connection()
-    try:
-        with conn, conn.cursor() as cur:
-            args_str = b",".join(
-                cur.mogrify("(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)", row)
-                for row in rows
-            )
-            cur.execute(
-                sql.SQL(f"INSERT INTO {{schema}}.{TABLE_NAME} ({COLS}) VALUES ").format(schema=sql.Identifier(SCHEMA))
-                + args_str +
-                sql.SQL(" ON CONFLICT DO NOTHING")
-            )
-        conn.commit()
-    finally:
-        release_connection(conn)
+    conn = get_thread_connection()
+    with conn, conn.cursor() as cur:
+        args_str = b",".join(
+            cur.mogrify("(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)", row)
+            for row in rows
+        )
+        cur.execute(
+            sql.SQL(f"INSERT INTO {{schema}}.{TABLE_NAME} ({COLS}) VALUES ").format(schema=sql.Identifier(SCHEMA))
+            + args_str +
+            sql.SQL(" ON CONFLICT DO NOTHING")
+        )
 
 # ─────────────── Main ───────────────────────
 def main(slug: str):
     lg = make_logger(slug.replace("/", "_"))
     ensure_table()
 
-    first_ev = get_event(slug)
+    first_ev = get_event_full(slug)
     if not first_ev:
         lg.error("event not found"); sys.exit(2)
 
@@ -153,20 +170,20 @@ def main(slug: str):
     lg.info("tracking %d markets in %s", len(mk_info), slug)
 
     while True:
-        ev = get_event(slug)
-        if not ev:
+        quotes = get_prices(list(mk_info))
+        if not quotes:
             time.sleep(5); continue
 
-        id2mk = {m["id"]: m for m in ev["markets"]}
         ts    = datetime.now(timezone.utc)
         rows  = []
 
         for mk_id, info in mk_info.items():
-            mk = id2mk.get(mk_id)
-            if not mk:
+            q = quotes.get(mk_id)
+            if not q:
                 continue
-            yes_bid = float(mk["bestBid"]) if mk.get("bestBid") else None
-            yes_ask = float(mk["bestAsk"]) if mk.get("bestAsk") else None
+            bid, ask = q
+            yes_bid = float(bid) if bid else None
+            yes_ask = float(ask) if ask else None
             no_bid  = 1 - yes_ask if yes_ask is not None else None
             no_ask  = 1 - yes_bid if yes_bid is not None else None
 
@@ -1,8 +1,13 @@
 import psycopg2
 from psycopg2 import sql, pool
+from psycopg2.extras import execute_values
 
+import io
+import atexit
+import functools
 import threading
 import logging 
+from datetime import date, datetime
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -63,6 +68,38 @@ def get_connection():
 def release_connection(conn):
     db_pool.release_connection(conn)
 
+# Per-thread pinned connections: long-lived writer threads take one connection
+# from the pool on first use and keep it, instead of hitting the pool lock on
+# every batch. All pinned connections are handed back at interpreter exit.
+_tls = threading.local()
+_pinned_conns = []
+_pinned_lock = threading.Lock()
+
+def get_thread_connection():
+    conn = getattr(_tls, "conn", None)
+    if conn is not None and not conn.closed:
+        return conn
+    with _pinned_lock:
+        if conn is not None:
+            # Closed by the server or a network error: let the pool discard it
+            _pinned_conns.remove(conn)
+            db_pool.release_connection(conn)
+        conn = db_pool.get_connection()
+        _pinned_conns.append(conn)
+    _tls.conn = conn
+    return conn
+
+def _release_pinned_connections():
+    with _pinned_lock:
+        for conn in _pinned_conns:
+            try:
+                db_pool.release_connection(conn)
+            except Exception as e:
+                logging.warning(f"Failed to release pinned connection: {e}")
+        _pinned_conns.clear()
+
+atexit.register(_release_pinned_connections)
+
 def get_schema_from_slug(slug: str) -> str:
     slug = slug.lower()
     if slug.startswith("kxhigh"):
@@ -77,9 +114,15 @@ def get_schema_from_slug(slug: str) -> str:
         return "crypto"
     return "public"
 
+# (schema, table) pairs already created/verified by this process; the DDL is
+# idempotent, so later monitors and reconnects can skip the round-trip
+_ensured = set()
+
 def ensure_table_exists(conn, slug):
     table_name = slug.replace("-", "_")
     schema_name = get_schema_from_slug(table_name)
+    if (schema_name, table_name) in _ensured:
+        return
 
     with conn.cursor() as cur:
         cur.execute(sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(sql.Identifier(schema_name)))
@@ -93,19 +136,73 @@ def ensure_table_exists(conn, slug):
             );
         """).format(sql.Identifier(schema_name), sql.Identifier(table_name)))
         conn.commit()
+    _ensured.add((schema_name, table_name))
+
+INSERT_MARKET_SQL = """
+    INSERT INTO {}.{} (timestamp, question, best_bid, best_ask)
+    VALUES %s
+"""
+
+COPY_MARKET_SQL = "COPY {}.{} (timestamp, question, best_bid, best_ask) FROM STDIN WITH (FORMAT text)"
+
+# Batches smaller than this go through one multi-row INSERT; COPY only pays off above it
+COPY_MIN_ROWS = 50
+
+@functools.lru_cache(maxsize=None)
+def _market_insert_sql(schema_name, table_name):
+    """INSERT ... VALUES %s template for one table, composed once and reused every poll."""
+    return sql.SQL(INSERT_MARKET_SQL).format(sql.Identifier(schema_name), sql.Identifier(table_name))
+
+def _execute_market_insert(conn, schema_name, table_name, vals):
+    with conn.cursor() as cur:
+        execute_values(cur, _market_insert_sql(schema_name, table_name), vals, page_size=500)
+
+def _format_value_for_copy(value):
+    """Render one value as a COPY TEXT field (\\N for NULL, backslash escapes)."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return (str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r"))
+
+def _insert_market_rows(conn, schema_name, table_name, vals):
+    """
+    Stream rows into schema.table with one COPY instead of INSERT statements.
+    Small batches, and servers/proxies that reject COPY, use a single
+    execute_values INSERT instead.
+    """
+    if len(vals) < COPY_MIN_ROWS:
+        _execute_market_insert(conn, schema_name, table_name, vals)
+        conn.commit()
+        return
+
+    buf = io.StringIO()
+    buf.writelines("\t".join(map(_format_value_for_copy, row)) + "\n" for row in vals)
+    buf.seek(0)
+    try:
+        with conn.cursor() as cur:
+            cur.copy_expert(
+                sql.SQL(COPY_MARKET_SQL).format(sql.Identifier(schema_name), sql.Identifier(table_name)).as_string(conn),
+                buf
+            )
+    except psycopg2.NotSupportedError as e:
+        logging.warning(f"COPY not supported ({e}), falling back to INSERT for {schema_name}.{table_name}")
+        conn.rollback()
+        _execute_market_insert(conn, schema_name, table_name, vals)
+    conn.commit()
 
 def insert_market_data(conn, slug, timestamp, markets_data):
     table_name = slug.replace("-", "_")
     schema_name = get_schema_from_slug(table_name)
 
-    with conn.cursor() as cur:
-        for market in markets_data:
-            cur.execute(sql.SQL("""
-                INSERT INTO {}.{} (timestamp, question, best_bid, best_ask)
-                VALUES (%s, %s, %s, %s)
-            """).format(sql.Identifier(schema_name), sql.Identifier(table_name)),
-            (timestamp, market['question'], market['best_bid'], market['best_ask']))
-        conn.commit()
+    vals = [(timestamp, m['question'], m['best_bid'], m['best_ask']) for m in markets_data]
+    _insert_market_rows(conn, schema_name, table_name, vals)
 
 
 def insert_kalshi_market_data(conn, slug, timestamp, markets_data):
@@ -114,14 +211,5 @@ def insert_kalshi_market_data(conn, slug, timestamp, markets_data):
 
     print(f"[INFO] Inserting into schema '{schema_name}' | table '{table_name}'")  # Debug log
 
-    with conn.cursor() as cur:
-        for market in markets_data:
-            cur.execute(sql.SQL("""
-                INSERT INTO {}.{} (timestamp, question, best_bid, best_ask)
-                VALUES (%s, %s, %s, %s)
-            """).format(
-                sql.Identifier(schema_name),
-                sql.Identifier(table_name)
-            ),
-            (timestamp, market['ticker'], market['best_bid'], market['best_ask']))
-        conn.commit()
+    vals = [(timestamp, m['ticker'], m['best_bid'], m['best_ask']) for m in markets_data]
+    _insert_market_rows(conn, schema_name, table_name, vals)
\ No newline at end of file
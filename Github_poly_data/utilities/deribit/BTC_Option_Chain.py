@@ -1,11 +1,19 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import ccxt
+import numpy as np
 import pandas as pd
 import re
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+# pyarrow 为可选依赖：缺失时退回 pandas.to_csv
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
 # ─── 配置 ───
 EXCHANGE_ID, UNDERLYING = "deribit", "BTC"
 SPOT_TICKER = "BTC/USDC"
@@ -18,6 +26,20 @@ PATH_SKIPPED = f"{EXCHANGE_ID}_{UNDERLYING}_opt_chain_SKIPPED.csv"
 MONTH_MAP = {m.upper(): i for i, m in enumerate(
     ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], 1)}
 
+_EXPIRY_RE = re.compile(r"(\d{1,2})([A-Z]{3})(\d{2})")  # 4JUL25 / 25JUL25
+_NUM_RE = re.compile(r"\d{5,6}")                      # 40625 / 250624
+
+# 输出列顺序；utc_ts / underlying_px / spot_px 每次运行为常量，不逐行累积
+COLUMNS = ("utc_ts", "underlying_px", "spot_px", "symbol", "type", "strike", "expiry_iso", "expiry",
+           "bid_coin", "ask_coin", "bid_usd", "ask_usd", "iv", "underlying", "contractSize",
+           "volume_coin", "volume_usd", "delta", "gamma", "vega", "theta")
+# 数值列在循环中只保存原始值，循环结束后统一 to_numeric；值为无法解析时的默认值
+NUMERIC_FILL = {"strike": 0.0, "bid_coin": 0.0, "ask_coin": 0.0, "iv": 0.0, "contractSize": 1.0,
+                "delta": 0.0, "gamma": 0.0, "vega": 0.0, "theta": 0.0}
+ROW_COLUMNS = tuple(c for c in COLUMNS[3:] if c not in ("bid_usd", "ask_usd"))
+FLOAT_COLUMNS = {"underlying_px", "spot_px", "strike", "bid_coin", "ask_coin", "bid_usd", "ask_usd", "iv",
+                 "contractSize", "volume_coin", "volume_usd", "delta", "gamma", "vega", "theta"}
+
 
 # ---------- 工具 ----------
 def safe_float(x, default=0.0):
@@ -28,23 +50,61 @@ def safe_float(x, default=0.0):
 
 
 def parse_expiry(tok: str) -> Optional[datetime]:
-    if re.fullmatch(r"\d{1,2}[A-Z]{3}\d{2}", tok):
-        d, mon, yy = re.match(r"(\d{1,2})([A-Z]{3})(\d{2})", tok).groups()
+    m = _EXPIRY_RE.fullmatch(tok)
+    if m:
+        d, mon, yy = m.groups()
         return datetime(2000 + int(yy), MONTH_MAP[mon], int(d), hour=8, tzinfo=timezone.utc)
-    if tok.isdigit() and 5 <= len(tok) <= 6:
+    if _NUM_RE.fullmatch(tok):
         tok = tok.zfill(6)
         return datetime(2000 + int(tok[:2]), int(tok[2:4]), int(tok[4:6]), hour=8, tzinfo=timezone.utc)
     return None
 
 
-def flatten(raw):  # dict→list
-    return [{"symbol_full": s, **d, **d.get("info", {})} for s, d in raw.items()]
+def flatten(raw):  # dict→(symbol, 统一字段, 交易所原始 info)，不做合并拷贝
+    for s, d in raw.items():
+        yield s, d, d.get("info", {})
 
 
 def is_target_option(inst: str) -> bool:
     return inst.startswith(f"{UNDERLYING}-") and inst.count("-") >= 3
 
 
+def new_columns() -> dict:  # 按列累积 (SoA)
+    return {c: [] for c in ROW_COLUMNS}
+
+
+def to_float_array(raw: list, default: float) -> np.ndarray:
+    return pd.to_numeric(pd.Series(raw, dtype=object), errors="coerce").fillna(default).to_numpy("float64")
+
+
+def build_frame(cols: dict, utc_ts: str, underlying_px, spot_px) -> pd.DataFrame:
+    n = len(cols["symbol"])
+    derived = {c: to_float_array(cols[c], fill) for c, fill in NUMERIC_FILL.items()}
+    if underlying_px:  # 0.0 / None 均视为无价格
+        derived["bid_usd"] = derived["bid_coin"] * underlying_px
+        derived["ask_usd"] = derived["ask_coin"] * underlying_px
+    else:
+        derived["bid_usd"] = derived["ask_usd"] = np.full(n, np.nan)
+    derived.update({"utc_ts": [utc_ts] * n, "underlying_px": [underlying_px] * n, "spot_px": [spot_px] * n})
+
+    data = {}
+    for c in COLUMNS:
+        v = derived[c] if c in derived else cols[c]
+        data[c] = np.asarray(v, dtype="float64") if c in FLOAT_COLUMNS else v
+    df = pd.DataFrame(data, columns=list(COLUMNS))
+    order = np.argsort(np.asarray(cols["expiry_iso"], dtype=object), kind="stable")
+    return df.take(order).reset_index(drop=True)
+
+
+def write_csv(df: pd.DataFrame, path: str) -> None:
+    if pa is None:
+        df.to_csv(path, index=False, encoding="utf-8")
+        return
+    # 列式 Arrow 表 + 多线程 C++ 编码，代替 to_csv 的逐格 Python 路径
+    tbl = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(tbl, path)
+
+
 # ---------- 主函数 ----------
 def BTC_Option_Chain():
     ex = getattr(ccxt, EXCHANGE_ID)({"enableRateLimit": True})
@@ -64,32 +124,30 @@ def BTC_Option_Chain():
         spot_px = None
 
     flat = flatten(ex.fetch_option_chain(UNDERLYING))
-    rows_main, rows_syn, rows_skip = [], [], []
+    cols_main, cols_syn, rows_skip = new_columns(), new_columns(), []
 
-    for r in flat:
-        inst = r["symbol_full"].split(":")[-1]
+    for s, d, info in flat:
+        inst = s.split(":")[-1]
         if not is_target_option(inst):
-            rows_skip.append({"reason": "not_target_option", **r})
+            rows_skip.append({"reason": "not_target_option", "symbol_full": s, **d, **info})
             continue
 
         _, tok, strike, opt_letter = inst.split("-")[:4]
         expiry_dt = parse_expiry(tok)
         if not expiry_dt:
-            rows_skip.append({"reason": "unparseable_expiry", "bad": tok, **r})
+            rows_skip.append({"reason": "unparseable_expiry", "bad": tok, "symbol_full": s, **d, **info})
             continue
         if expiry_dt < cutoff_low:
-            rows_skip.append({"reason": "already_expired", "exp": expiry_dt, **r})
+            rows_skip.append({"reason": "already_expired", "exp": expiry_dt, "symbol_full": s, **d, **info})
             continue
         if expiry_dt > cutoff_high:
-            rows_skip.append({"reason": "beyond_6m", "exp": expiry_dt, **r})
+            rows_skip.append({"reason": "beyond_6m", "exp": expiry_dt, "symbol_full": s, **d, **info})
             continue
 
-        bid_coin = safe_float(r.get("bid_price"))
-        ask_coin = safe_float(r.get("ask_price"))
-        greeks = r.get("greeks", {}) # 提前获取greeks字典，方便复用
+        greeks = info.get("greeks") or d.get("greeks") or {} # 提前获取greeks字典，方便复用
 
         try:
-            ticker = ex.fetch_ticker(r["symbol_full"])
+            ticker = ex.fetch_ticker(s)
             volume_coin = safe_float(ticker.get("baseVolume"))
             volume_usd = safe_float(ticker.get("quoteVolume"))
         except Exception as e:
@@ -97,43 +155,40 @@ def BTC_Option_Chain():
             volume_coin = None
             volume_usd = None
 
-        rec = {
-            "utc_ts":             now.isoformat(timespec="seconds"),
-            "underlying_px":      underlying_px,
-            "spot_px":            spot_px,
-            "symbol":             inst,
-            "type":               "call" if opt_letter.upper() == "C" else "put",
-            "strike":             safe_float(strike),
-            "expiry_iso":         expiry_dt.isoformat(),
-            "expiry":             expiry_dt,
-            "bid_coin":           bid_coin,
-            "ask_coin":           ask_coin,
-            "bid_usd":            bid_coin * underlying_px if underlying_px else None,
-            "ask_usd":            ask_coin * underlying_px if underlying_px else None,
-            "iv":                 safe_float(r.get("mark_iv") or r.get("impliedVolatility")),
-            "underlying":         r.get("underlying_index"),
-            "contractSize":       safe_float(r.get("contract_size"), 1.0),
-            "volume_coin":        volume_coin,
-            "volume_usd":         volume_usd,
-            # ▼▼▼ 新增Greeks ▼▼▼
-            "delta":              safe_float(greeks.get("delta")),
-            "gamma":              safe_float(greeks.get("gamma")),
-            "vega":               safe_float(greeks.get("vega")),
-            "theta":              safe_float(greeks.get("theta")),
-        }
-
-        target_list = rows_syn if str(r.get("underlying_index", "")).startswith("SYN.") else rows_main
-        target_list.append(rec)
-
-    pd.DataFrame(rows_main).sort_values("expiry_iso").to_csv(PATH_MAIN, index=False, encoding="utf-8")
-    pd.DataFrame(rows_syn).sort_values("expiry_iso").to_csv(PATH_SYN, index=False, encoding="utf-8")
-    pd.DataFrame(rows_skip).to_csv(PATH_SKIPPED, index=False, encoding="utf-8")
-
-    print(f"\n✅  非-SYN : {len(rows_main):4d} rows → {PATH_MAIN}")
-    print(f"✅  SYN    : {len(rows_syn):4d} rows → {PATH_SYN}")
-    print(f"🚫  跳过   : {len(rows_skip):4d} rows → {PATH_SKIPPED}")
-
-    return pd.DataFrame(rows_main), pd.DataFrame(rows_syn), pd.DataFrame(rows_skip)
+        underlying = info.get("underlying_index")
+        cols = cols_syn if str(underlying or "").startswith("SYN.") else cols_main
+        cols["symbol"].append(inst)
+        cols["type"].append("call" if opt_letter.upper() == "C" else "put")
+        cols["strike"].append(strike)
+        cols["expiry_iso"].append(expiry_dt.isoformat())
+        cols["expiry"].append(expiry_dt)
+        cols["bid_coin"].append(info.get("bid_price"))
+        cols["ask_coin"].append(info.get("ask_price"))
+        cols["iv"].append(info.get("mark_iv") or d.get("impliedVolatility"))
+        cols["underlying"].append(underlying)
+        cols["contractSize"].append(info.get("contract_size"))
+        cols["volume_coin"].append(volume_coin)
+        cols["volume_usd"].append(volume_usd)
+        # ▼▼▼ 新增Greeks ▼▼▼
+        cols["delta"].append(greeks.get("delta"))
+        cols["gamma"].append(greeks.get("gamma"))
+        cols["vega"].append(greeks.get("vega"))
+        cols["theta"].append(greeks.get("theta"))
+
+    utc_ts = now.isoformat(timespec="seconds")
+    df_main = build_frame(cols_main, utc_ts, underlying_px, spot_px)
+    df_syn = build_frame(cols_syn, utc_ts, underlying_px, spot_px)
+    df_skip = pd.DataFrame(rows_skip)
+
+    write_csv(df_main, PATH_MAIN)
+    write_csv(df_syn, PATH_SYN)
+    df_skip.to_csv(PATH_SKIPPED, index=False, encoding="utf-8")
+
+    print(f"\n✅  非-SYN : {len(df_main):4d} rows → {PATH_MAIN}")
+    print(f"✅  SYN    : {len(df_syn):4d} rows → {PATH_SYN}")
+    print(f"🚫  跳过   : {len(df_skip):4d} rows → {PATH_SKIPPED}")
+
+    return df_main, df_syn, df_skip
 
 
 if __name__ == "__main__":
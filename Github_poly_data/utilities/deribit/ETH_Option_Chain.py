@@ -16,6 +16,9 @@ PATH_SKIPPED = f"{EXCHANGE_ID}_{UNDERLYING}_opt_chain_SKIPPED.csv"
 MONTH_MAP = {m.upper(): i for i, m in enumerate(
     ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], 1)}
 
+_EXPIRY_RE = re.compile(r"(\d{1,2})([A-Z]{3})(\d{2})")  # 4JUL25 / 25JUL25
+_NUM_RE = re.compile(r"\d{5,6}")                      # 40625 / 250624
+
 
 # ---------- 工具 ----------
 def safe_float(x, default=0.0):
@@ -25,10 +28,11 @@ def safe_float(x, default=0.0):
         return default
 
 def parse_expiry(tok: str) -> Optional[datetime]:
-    if re.fullmatch(r"\d{1,2}[A-Z]{3}\d{2}", tok):
-        d, mon, yy = re.match(r"(\d{1,2})([A-Z]{3})(\d{2})", tok).groups()
+    m = _EXPIRY_RE.fullmatch(tok)
+    if m:
+        d, mon, yy = m.groups()
         return datetime(2000 + int(yy), MONTH_MAP[mon], int(d), hour=8, tzinfo=timezone.utc)
-    if tok.isdigit() and 5 <= len(tok) <= 6:
+    if _NUM_RE.fullmatch(tok):
         tok = tok.zfill(6)
         return datetime(2000 + int(tok[:2]), int(tok[2:4]), int(tok[4:6]), hour=8, tzinfo=timezone.utc)
     return None
@@ -1,13 +1,12 @@
 import time
-import schedule
 import logging
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta, timezone, time as dt_time
 
 from psycopg2 import sql
 from psycopg2.extras import execute_values
 
-from utilities.db_utils import get_connection, release_connection
+from utilities.db_utils import get_thread_connection
 from utilities.deribit.ETH_Option_Chain import ETH_Option_Chain
 
 SCHEMA_NAME = "Crypto_Option"
@@ -61,35 +60,41 @@ def pg_batch_insert(df, table_base_name, symbol_name="eth"):
     df['run_ts'] = pd.to_datetime(df['utc_ts'])
     table_name = f"{table_base_name}_{df['run_ts'].iloc[0].strftime('%Y%m%d')}"
 
-    conn = get_connection()
-    try:
-        with conn.cursor() as cur:
-            cur.execute(sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(sql.Identifier(SCHEMA_NAME)))
-            cur.execute(
-                sql.SQL(CREATE_SQL).format(schema=sql.Identifier(SCHEMA_NAME), table=sql.Identifier(table_name)))
-
-            # ▼▼▼ 关键改动：在待插入列中增加所有新字段 ▼▼▼
-            columns_to_insert = [
-                "run_ts", "spot_px", "symbol", "type", "strike", "expiry",
-                "iv", "underlying", "contractSize",
-                "bid_coin", "ask_coin", "bid_usd", "ask_usd",
-                "volume_coin", "volume_usd",
-                "delta", "gamma", "vega", "theta"
-            ]
-
-            if not all(col in df.columns for col in columns_to_insert):
-                missing_cols = [col for col in columns_to_insert if col not in df.columns]
-                logging.error(f"DataFrame is missing required columns for table {table_name}: {missing_cols}")
-                return
-
-            execute_values(
-                cur,
-                sql.SQL(INSERT_SQL).format(schema=sql.Identifier(SCHEMA_NAME), table=sql.Identifier(table_name)),
-                df[columns_to_insert].to_records(index=False).tolist()
-            )
-        conn.commit()
-    finally:
-        release_connection(conn)
+    # ▼▼▼ 关键改动：在待插入列中增加所有新字段 ▼▼▼
+    columns_to_insert = [
+        "run_ts", "spot_px", "symbol", "type", "strike", "expiry",
+        "iv", "underlying", "contractSize",
+        "bid_coin", "ask_coin", "bid_usd", "ask_usd",
+        "volume_coin", "volume_usd",
+        "delta", "gamma", "vega", "theta"
+    ]
+
+    if not all(col in df.columns for col in columns_to_insert):
+        missing_cols = [col for col in columns_to_insert if col not in df.columns]
+        logging.error(f"DataFrame is missing required columns for table {table_name}: {missing_cols}")
+        return
+
+    # 在拿连接之前完成行转换，缩短占用连接的时间
+    payload = list(df[columns_to_insert].itertuples(index=False, name=None))
+
+    # 固定在当前线程的连接，不归还到连接池；with conn 负责 commit / rollback
+    conn = get_thread_connection()
+    with conn, conn.cursor() as cur:
+        cur.execute(sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(sql.Identifier(SCHEMA_NAME)))
+        cur.execute(
+            sql.SQL(CREATE_SQL).format(schema=sql.Identifier(SCHEMA_NAME), table=sql.Identifier(table_name)))
+
+        execute_values(
+            cur,
+            sql.SQL(INSERT_SQL).format(schema=sql.Identifier(SCHEMA_NAME), table=sql.Identifier(table_name)),
+            payload
+        )
+
+
+def next_run_after(now: datetime) -> datetime:
+    hh, mm = map(int, RUN_TIME_UTC.split(":"))
+    target = datetime.combine(now.date(), dt_time(hh, mm), tzinfo=timezone.utc)
+    return target if target > now else target + timedelta(days=1)
 
 
 def daily_job():
@@ -111,10 +116,12 @@ if __name__ == "__main__":
     )
 
     daily_job()
-    schedule.every().day.at(RUN_TIME_UTC).do(daily_job)
+    next_run = next_run_after(datetime.now(timezone.utc))
 
     logging.info(f"🕑  Scheduler started — will run daily at {RUN_TIME_UTC} UTC")
 
+    # 直接睡到下一次触发时间，不再每分钟轮询
     while True:
-        schedule.run_pending()
-        time.sleep(60)
\ No newline at end of file
+        time.sleep(max(0.0, (next_run - datetime.now(timezone.utc)).total_seconds()))
+        daily_job()
+        next_run += timedelta(days=1)
\ No newline at end of file
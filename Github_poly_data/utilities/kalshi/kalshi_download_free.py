@@ -1,13 +1,38 @@
 # general script
 import time
 import json
+import asyncio
 import requests
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import uuid
-import base64
 from datetime import datetime
 import os
 import csv
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import psycopg2
+import numpy as np
+
+# pybase64 (SIMD base64) is optional, same API as the stdlib module
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+# aiohttp is optional: only needed for the asyncio monitor (monitor_events_async)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# orjson is optional: faster JSON with compact, UTF-8 output
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import crypto libraries for RSA signing
 try:
@@ -25,6 +50,7 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 import sys
 sys.path.append(str(PROJECT_ROOT))
 from utilities.db_utils import get_connection, release_connection, ensure_table_exists, insert_kalshi_market_data
+from utilities.poll_utils import next_tick
 
 # Kalshi API base URLs
 KALSHI_ELECTIONS_API_URL = "https://api.elections.kalshi.com/trade-api/v2"  # For election markets (KX tickers)
@@ -38,6 +64,21 @@ KALSHI_API_BASE_URL = KALSHI_ELECTIONS_API_URL
 
 LOCAL_BACKUP_DIR = "kalshi_local_backup"
 
+def _json_dumps(obj):
+    """
+    Serialize a request body to the exact text that is signed (and should be sent).
+    The stdlib fallback uses the same compact separators as orjson.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+def _json_loads(content):
+    """Parse a response body straight from bytes (no text decoding pass)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 class KalshiAPI:
     def __init__(self, email=None, password=None, api_key=None, key_id=None):
         """
@@ -46,6 +87,19 @@ class KalshiAPI:
         """
         self.auth_token = None
         self.headers = {"accept": "application/json"}
+        self._use_api_key_auth = False  # set by set_api_key_auth once credentials are stored
+
+        # Persistent session: keep-alive across polls, transient 429/5xx retried with backoff
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        self._session.mount("https://", HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=16))
         
         if email and password:
             self.login(email, password)
@@ -65,9 +119,9 @@ class KalshiAPI:
         }
         
         try:
-            response = requests.post(url, json=payload, headers=self.headers)
+            response = self._session.post(url, json=payload, headers=self.headers)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 self.auth_token = data.get('token')
                 self.headers['Authorization'] = f"Bearer {self.auth_token}"
                 print("Successfully logged in")
@@ -97,22 +151,32 @@ class KalshiAPI:
             # Check if we have the necessary crypto libraries
             if 'load_pem_private_key' not in globals():
                 print("Warning: Cryptography libraries not imported. Cannot verify key.")
+                private_key = None
             else:
-                # Try to load the key to verify it
-                load_pem_private_key(
+                # Load the key once to verify it; the parsed key is reused for every signature
+                private_key = load_pem_private_key(
                     private_key_str.encode(),
                     password=None,
                     backend=default_backend()
                 )
+                # Signing parameters are immutable, build them once as well
+                self._hash = hashes.SHA256()
+                # Salt length = SHA-256 digest size, as Kalshi's reference signer uses
+                self._pss_padding = padding.PSS(
+                    mgf=padding.MGF1(hashes.SHA256()),
+                    salt_length=padding.PSS.DIGEST_LENGTH
+                )
                 
             # Store the credentials
             self.private_key_str = private_key_str
+            self._private_key = private_key
             self.key_id = key_id
             
             # No Authorization header for API key auth - we'll create custom headers per request
             if 'Authorization' in self.headers:
                 del self.headers['Authorization']
                 
+            self._use_api_key_auth = True
             print("API key authentication successfully configured")
             return True
         except Exception as e:
@@ -126,10 +190,12 @@ class KalshiAPI:
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API endpoint path
-            body: Request body for POST/PUT requests
+            body: Request body for POST/PUT requests. A dict is signed as its compact
+                  JSON text (see _json_dumps); send the same text as the request body.
             
         Returns:
-            Dictionary of headers to add to the request
+            The full request headers: self.headers plus the KALSHI-ACCESS-* fields,
+            built as one dict (self.headers alone if signing fails)
         """
         # Current timestamp in milliseconds
         timestamp = str(int(time.time() * 1000))
@@ -140,44 +206,34 @@ class KalshiAPI:
         # If there's a body, include it in the message
         if body:
             if isinstance(body, dict):
-                body_str = json.dumps(body)
+                body_str = _json_dumps(body)
             else:
                 body_str = body
             message += body_str
         
         try:
-            # Load the private key
-            private_key = load_pem_private_key(
-                self.private_key_str.encode(),
-                password=None,
-                backend=default_backend()
-            )
-            
-            # Sign the message
-            signature = private_key.sign(
-                message.encode(),
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
-            )
+            if self._private_key is None:
+                raise NameError("private key was not loaded")
+
+            # Sign the message with the key parsed in set_api_key_auth
+            signature = self._private_key.sign(message.encode(), self._pss_padding, self._hash)
             
             # Base64 encode the signature
-            signature_b64 = base64.b64encode(signature).decode()
+            signature_b64 = _b64.b64encode(signature).decode('ascii')
             
             # Return the headers
             return {
+                **self.headers,
                 'KALSHI-ACCESS-KEY': self.key_id,
                 'KALSHI-ACCESS-SIGNATURE': signature_b64,
                 'KALSHI-ACCESS-TIMESTAMP': timestamp
             }
         except NameError:
             print("Error: Cryptography libraries not available. Cannot sign request.")
-            return {}
+            return self.headers
         except Exception as e:
             print(f"Error signing request: {str(e)}")
-            return {}
+            return self.headers
     
     def get_exchange_status(self):
         """
@@ -188,13 +244,11 @@ class KalshiAPI:
         
         try:
             # Add signature headers if using API key auth
-            headers = self.headers.copy()
-            if hasattr(self, 'key_id') and hasattr(self, 'private_key_str'):
-                headers.update(self._sign_request("GET", path))
+            headers = self._sign_request("GET", path) if self._use_api_key_auth else self.headers
             
-            response = requests.get(url, headers=headers)
+            response = self._session.get(url, headers=headers)
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
             else:
                 print(f"Error getting exchange status: {response.status_code} - {response.text}")
                 return None
@@ -211,13 +265,11 @@ class KalshiAPI:
         
         try:
             # Add signature headers if using API key auth
-            headers = self.headers.copy()
-            if hasattr(self, 'key_id') and hasattr(self, 'private_key_str'):
-                headers.update(self._sign_request("GET", path))
+            headers = self._sign_request("GET", path) if self._use_api_key_auth else self.headers
                 
-            response = requests.get(url, headers=headers)
+            response = self._session.get(url, headers=headers)
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
             else:
                 print(f"Error fetching event data: {response.status_code} - {response.text}")
                 return None
@@ -234,13 +286,11 @@ class KalshiAPI:
         
         try:
             # Add signature headers if using API key auth
-            headers = self.headers.copy()
-            if hasattr(self, 'key_id') and hasattr(self, 'private_key_str'):
-                headers.update(self._sign_request("GET", path))
+            headers = self._sign_request("GET", path) if self._use_api_key_auth else self.headers
                 
-            response = requests.get(url, headers=headers)
+            response = self._session.get(url, headers=headers)
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
             else:
                 print(f"Error fetching market data: {response.status_code} - {response.text}")
                 return None
@@ -257,13 +307,11 @@ class KalshiAPI:
         
         try:
             # Add signature headers if using API key auth
-            headers = self.headers.copy()
-            if hasattr(self, 'key_id') and hasattr(self, 'private_key_str'):
-                headers.update(self._sign_request("GET", path))
+            headers = self._sign_request("GET", path) if self._use_api_key_auth else self.headers
                 
-            response = requests.get(url, headers=headers)
+            response = self._session.get(url, headers=headers)
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
             else:
                 print(f"Error fetching orderbook: {response.status_code} - {response.text}")
                 return None
@@ -271,6 +319,19 @@ class KalshiAPI:
             print(f"Exception while fetching orderbook: {str(e)}")
             return None
         
+    def _get_prepared(self, url, params):
+        """
+        Prepare a GET with query params and, under API key auth, sign the query exactly
+        as requests encoded it (PreparedRequest.path_url, relative to the API base
+        path like every other signed path), then send that same prepared request.
+        """
+        prepared = self._session.prepare_request(requests.Request("GET", url, params=params, headers=self.headers))
+        if self._use_api_key_auth:
+            base_path = urlsplit(KALSHI_API_BASE_URL).path
+            prepared.headers.update(self._sign_request("GET", prepared.path_url[len(base_path):]))
+        settings = self._session.merge_environment_settings(prepared.url, {}, None, None, None)
+        return self._session.send(prepared, **settings)
+
     def fetch_all_events(self, status="open", series_ticker=None, limit=100, cursor=None):
         """
         Fetch multiple events with optional filtering
@@ -289,17 +350,9 @@ class KalshiAPI:
             params["cursor"] = cursor
         
         try:
-            # Add signature headers if using API key auth
-            headers = self.headers.copy()
-            if hasattr(self, 'key_id') and hasattr(self, 'private_key_str'):
-                # Add query params to the path for signing
-                query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-                sign_path = f"{path}?{query_string}" if query_string else path
-                headers.update(self._sign_request("GET", sign_path))
-            
-            response = requests.get(url, params=params, headers=headers)
+            response = self._get_prepared(url, params)
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
             else:
                 print(f"Error fetching events: {response.status_code} - {response.text}")
                 return None
@@ -325,17 +378,9 @@ class KalshiAPI:
             params["cursor"] = cursor
         
         try:
-            # Add signature headers if using API key auth
-            headers = self.headers.copy()
-            if hasattr(self, 'key_id') and hasattr(self, 'private_key_str'):
-                # Add query params to the path for signing
-                query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-                sign_path = f"{path}?{query_string}" if query_string else path
-                headers.update(self._sign_request("GET", sign_path))
-            
-            response = requests.get(url, params=params, headers=headers)
+            response = self._get_prepared(url, params)
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
             else:
                 print(f"Error fetching markets: {response.status_code} - {response.text}")
                 return None
@@ -343,6 +388,28 @@ class KalshiAPI:
             print(f"Exception while fetching markets: {str(e)}")
             return None
 
+    async def get_event_by_ticker_async(self, session, event_ticker):
+        """
+        aiohttp version of get_event_by_ticker, for monitor_events_async.
+        session: an aiohttp.ClientSession shared by all monitored tickers.
+        """
+        path = f"/events/{event_ticker}"
+        url = f"{KALSHI_API_BASE_URL}{path}"
+        
+        try:
+            # Add signature headers if using API key auth
+            headers = self._sign_request("GET", path) if self._use_api_key_auth else self.headers
+                
+            async with session.get(url, headers=headers) as response:
+                if response.status == 200:
+                    return _json_loads(await response.read())
+                else:
+                    print(f"Error fetching event data: {response.status} - {await response.text()}")
+                    return None
+        except Exception as e:
+            print(f"Exception while fetching event data: {str(e)}")
+            return None
+
 def print_available_events(kalshi_api, limit=5, status="open"):
     """
     Print a list of available events to help find the right ticker
@@ -354,14 +421,21 @@ def print_available_events(kalshi_api, limit=5, status="open"):
         return
     
     events = events_response.get('events', [])
+
+    # Fetch markets for all events concurrently (I/O bound), then print in order
+    markets_responses = []
+    if events:
+        with ThreadPoolExecutor(max_workers=min(8, len(events))) as pool:
+            markets_responses = list(pool.map(
+                lambda e: kalshi_api.fetch_all_markets(event_ticker=e.get('event_ticker'), limit=5),
+                events
+            ))
     
     print("\n=== Available Events ===")
-    for i, event in enumerate(events):
+    for i, (event, markets_response) in enumerate(zip(events, markets_responses)):
         
         print(f"{i+1}. {event.get('title')} {event.get('sub_title')} (Ticker: {event.get('event_ticker')})")
 
-        # Fetch markets for this event
-        markets_response = kalshi_api.fetch_all_markets(event_ticker=event.get('event_ticker'), limit=5)
         markets = markets_response.get('markets', []) if markets_response else []
         
         # Print markets within this event
@@ -369,24 +443,40 @@ def print_available_events(kalshi_api, limit=5, status="open"):
             print(f"   {i+1}.{j+1}. Market: {market.get('title')} (Ticker: {market.get('ticker')})")
     print("========================\n")
 
+# Backup CSVs stay open between writes (one handle per file) so a DB outage
+# doesn't reopen the file every poll; all handles are closed at exit.
+_backup_files = {}
+_backup_lock = threading.Lock()
+
+def _close_backup_files():
+    with _backup_lock:
+        for f, _ in _backup_files.values():
+            f.close()
+        _backup_files.clear()
+
+atexit.register(_close_backup_files)
+
 def save_market_data_locally(event_ticker, timestamp, markets_data, local_dir=LOCAL_BACKUP_DIR):
     """Save the market data to a local CSV if DB insert fails."""
-    os.makedirs(local_dir, exist_ok=True)
     filename = os.path.join(local_dir, f"{event_ticker.lower()}.csv")
-    file_exists = os.path.isfile(filename)
-
-    with open(filename, mode="a", newline='', encoding="utf-8") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(["timestamp", "ticker", "title", "best_bid", "best_ask"])
-        for market in markets_data:
-            writer.writerow([
-                timestamp,
-                market["ticker"],
-                market["title"],
-                market["best_bid"],
-                market["best_ask"]
-            ])
+
+    with _backup_lock:
+        entry = _backup_files.get(filename)
+        if entry is None:
+            os.makedirs(local_dir, exist_ok=True)
+            file_exists = os.path.isfile(filename)
+            f = open(filename, mode="a", newline='', encoding="utf-8", buffering=65536)
+            writer = csv.writer(f)
+            if not file_exists:
+                writer.writerow(["timestamp", "ticker", "title", "best_bid", "best_ask"])
+            entry = _backup_files[filename] = (f, writer)
+        f, writer = entry
+        writer.writerows([
+            [timestamp, m["ticker"], m["title"], m["best_bid"], m["best_ask"]]
+            for m in markets_data
+        ])
+        # One flush per batch: the rows are on disk even if the process dies afterwards
+        f.flush()
 
 def is_event_active(event_data):
     """Check if an event is still active."""
@@ -396,39 +486,42 @@ def extract_market_data(event_data, kalshi_api=None):
     """
     Extract market data from event. Cleaned version.
     """
-    markets = event_data.get('markets', [])
-    markets_data = []
-    
-    for market in markets:
-        ticker = market.get('ticker')
-        title = market.get('title', '')
+    # Skip markets with no ticker
+    markets = [m for m in event_data.get('markets', []) if m.get('ticker')]
+    if not markets:
+        return []
+
+    # Prices as float columns (None -> NaN), converted from cents in one pass
+    bids = np.array([m.get('yes_bid') for m in markets], dtype=np.float64) / 100.0
+    asks = np.array([m.get('yes_ask') for m in markets], dtype=np.float64) / 100.0
+    last = np.array([m.get('last_price') for m in markets], dtype=np.float64) / 100.0
+
+    # If bid or ask missing, fallback to last price
+    bids = np.where(np.isnan(bids), last, bids)
+    asks = np.where(np.isnan(asks), last, asks)
+
+    # Back to Python floats, NaN -> None (NULL in the DB / empty in CSV)
+    return [
+        {
+            'ticker': m['ticker'],
+            'title': m.get('title', ''),
+            'best_bid': None if b != b else b,
+            'best_ask': None if a != a else a
+        }
+        for m, b, a in zip(markets, bids.tolist(), asks.tolist())
+    ]
 
-        if not ticker:
-            continue  # Skip markets with no ticker
-        
-        yes_bid = market.get('yes_bid')
-        yes_ask = market.get('yes_ask')
-
-        # Convert prices if they exist
-        best_bid = yes_bid / 100.0 if yes_bid is not None else None
-        best_ask = yes_ask / 100.0 if yes_ask is not None else None
-
-        # If bid or ask missing, try to fallback to last price
-        if (best_bid is None or best_ask is None) and 'last_price' in market:
-            last_price = market.get('last_price') / 100.0
-            if best_bid is None:
-                best_bid = last_price
-            if best_ask is None:
-                best_ask = last_price
-
-        markets_data.append({
-            'ticker': ticker,
-            'title': title,
-            'best_bid': best_bid,
-            'best_ask': best_ask
-        })
-    
-    return markets_data
+def _connection_alive(conn):
+    """Return True if conn is open and still answers a ping."""
+    if conn.closed:
+        return False
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
 
 def monitor_event(kalshi_api, event_ticker, interval_seconds=60, max_retries=3, retry_delay=10):
     """Continuously monitor an event and insert market data."""
@@ -436,61 +529,159 @@ def monitor_event(kalshi_api, event_ticker, interval_seconds=60, max_retries=3,
 
     attempt = 0
 
-    while attempt < max_retries:
-        conn = get_connection()
+    # One connection for the whole monitor: retries reuse it while it is healthy,
+    # and the table only needs to be ensured once.
+    conn = get_connection()
+    try:
         ensure_table_exists(conn, event_ticker)
 
-        try:
-            while True:
-                timestamp = datetime.utcnow().isoformat()
-                event_data = kalshi_api.get_event_by_ticker(event_ticker)
+        while attempt < max_retries:
+            if attempt and not _connection_alive(conn):
+                release_connection(conn)  # the pool discards closed/broken connections
+                conn = None  # already returned: don't release it again if get_connection() fails
+                conn = get_connection()
+
+            try:
+                deadline = time.monotonic()
+                while True:
+                    # One clock read per poll: the logged and inserted timestamps match
+                    now = datetime.utcnow()
+                    timestamp = now.isoformat()
+                    # Always fetch fresh: the quotes from a poll whose insert failed are
+                    # already in the local backup under that poll's timestamp, so
+                    # reusing them here would store the same observation twice.
+                    event_data = kalshi_api.get_event_by_ticker(event_ticker)
+
+                    if not is_event_active(event_data):
+                        print(f"{timestamp} | Event {event_ticker} closed. Stopping monitor.")
+                        return  # Exit the function if the market is closed
+
+                    markets_data = extract_market_data(event_data, kalshi_api)
+
+                    if markets_data:
+                        try:
+                            if conn.closed:
+                                raise psycopg2.OperationalError("Connection closed unexpectedly")
+
+                            insert_kalshi_market_data(conn, event_ticker, now, markets_data)
+                            print(f"{timestamp} | Inserted {len(markets_data)} markets.")
+
+                        except psycopg2.OperationalError as e:
+                            print(f"{timestamp} | DB Error: {e}")
+                            print(f"{timestamp} | Saving locally...")
+                            save_market_data_locally(event_ticker, timestamp, markets_data)
+
+                            # Retry logic
+                            print(f"{timestamp} | Retrying connection in {retry_delay} seconds...")
+                            time.sleep(retry_delay)
+                            attempt += 1
+                            break  # Exit the inner loop to reconnect
+
+                        except Exception as e:
+                            print(f"{timestamp} | Unexpected Error: {e}")
+                            print(f"{timestamp} | Saving locally...")
+                            save_market_data_locally(event_ticker, timestamp, markets_data)
+
+                    else:
+                        print(f"{timestamp} | No active markets found for {event_ticker}")
+
+                    sleep_for, deadline = next_tick(deadline, interval_seconds)
+                    time.sleep(sleep_for)
+
+            except Exception as e:
+                print(f"{timestamp} | Critical error in monitor loop: {e}")
+                attempt += 1
+                print(f"{timestamp} | Retrying in {retry_delay} seconds...")
+                time.sleep(retry_delay)
+
+        print(f"{event_ticker} | Exceeded maximum retries. Giving up.")
+
+    finally:
+        if conn is not None:
+            release_connection(conn)
+            print(f"Released database connection for event: {event_ticker}")
+
+async def _monitor_event_async(kalshi_api, session, event_ticker, interval_seconds=60, max_retries=3, retry_delay=10):
+    """
+    Same loop as monitor_event, as a coroutine. HTTP waits and sleeps yield to the
+    other monitors; the blocking psycopg2 calls run in the default thread pool.
+    """
+    print(f"Starting to monitor event: {event_ticker}")
+
+    attempt = 0
+    conn = None
+
+    try:
+        deadline = time.monotonic()
+        while attempt < max_retries:
+            now = datetime.utcnow()
+            timestamp = now.isoformat()
+            try:
+                if conn is None or conn.closed:
+                    if conn is not None:
+                        release_connection(conn)
+                    conn = await asyncio.to_thread(get_connection)
+                    await asyncio.to_thread(ensure_table_exists, conn, event_ticker)
+
+                event_data = await kalshi_api.get_event_by_ticker_async(session, event_ticker)
 
                 if not is_event_active(event_data):
                     print(f"{timestamp} | Event {event_ticker} closed. Stopping monitor.")
-                    return  # Exit the function if the market is closed
+                    return
 
                 markets_data = extract_market_data(event_data, kalshi_api)
 
                 if markets_data:
                     try:
-                        if conn.closed:
-                            raise psycopg2.OperationalError("Connection closed unexpectedly")
-
-                        insert_kalshi_market_data(conn, event_ticker, datetime.utcnow(), markets_data)
+                        await asyncio.to_thread(insert_kalshi_market_data, conn, event_ticker, now, markets_data)
                         print(f"{timestamp} | Inserted {len(markets_data)} markets.")
-
                     except psycopg2.OperationalError as e:
                         print(f"{timestamp} | DB Error: {e}")
                         print(f"{timestamp} | Saving locally...")
                         save_market_data_locally(event_ticker, timestamp, markets_data)
-
-                        # Retry logic
                         print(f"{timestamp} | Retrying connection in {retry_delay} seconds...")
-                        time.sleep(retry_delay)
+                        release_connection(conn)
+                        conn = None
                         attempt += 1
-                        break  # Exit the inner loop to reconnect
-
+                        await asyncio.sleep(retry_delay)
+                        continue
                     except Exception as e:
                         print(f"{timestamp} | Unexpected Error: {e}")
                         print(f"{timestamp} | Saving locally...")
                         save_market_data_locally(event_ticker, timestamp, markets_data)
-
                 else:
                     print(f"{timestamp} | No active markets found for {event_ticker}")
 
-                time.sleep(interval_seconds)
+                sleep_for, deadline = next_tick(deadline, interval_seconds)
+                await asyncio.sleep(sleep_for)
 
-        except Exception as e:
-            print(f"{timestamp} | Critical error in monitor loop: {e}")
-            attempt += 1
-            print(f"{timestamp} | Retrying in {retry_delay} seconds...")
-            time.sleep(retry_delay)
+            except Exception as e:
+                print(f"{timestamp} | Critical error in monitor loop: {e}")
+                attempt += 1
+                print(f"{timestamp} | Retrying in {retry_delay} seconds...")
+                await asyncio.sleep(retry_delay)
+
+        print(f"{event_ticker} | Exceeded maximum retries. Giving up.")
 
-        finally:
+    finally:
+        if conn is not None:
             release_connection(conn)
             print(f"Released database connection for event: {event_ticker}")
 
-    print(f"{event_ticker} | Exceeded maximum retries. Giving up.")
+async def monitor_events_async(kalshi_api, event_tickers, interval_seconds=60):
+    """
+    Monitor many events concurrently in one thread, sharing one aiohttp connection
+    pool (64 connections, 5 min DNS cache). Requires aiohttp.
+    """
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is required for monitor_events_async: pip install aiohttp")
+
+    connector = aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(*(
+            _monitor_event_async(kalshi_api, session, ticker, interval_seconds)
+            for ticker in event_tickers
+        ))
 
 def main():
     # 读取 API 密钥
@@ -524,6 +715,24 @@ def main():
     # 显示可选事件
     print_available_events(kalshi_api)
 
+    # ✅ 多个 ticker: 同一进程内并发监控 (有 aiohttp 用异步, 否则每个 ticker 一个线程)
+    if len(sys.argv) > 2:
+        tickers = [t.upper() for t in sys.argv[1:]]
+        print(f"⚙️ Using command-line tickers: {', '.join(tickers)}")
+        if aiohttp is not None:
+            asyncio.run(monitor_events_async(kalshi_api, tickers))
+        else:
+            print("aiohttp not installed: monitoring each ticker in its own thread")
+            threads = [
+                threading.Thread(target=monitor_event, args=(kalshi_api, t), name=t)
+                for t in tickers
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        return
+
     # ✅ 支持命令行传入 ticker
     if len(sys.argv) > 1:
         ticker = sys.argv[1]
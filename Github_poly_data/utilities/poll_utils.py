@@ -0,0 +1,15 @@
+import time
+
+def next_tick(deadline, interval_seconds):
+    """
+    Advance a time.monotonic() deadline by one polling interval, skipping ticks
+    that were already missed, so polls stay on a fixed grid instead of drifting
+    by the time each poll takes. Returns (seconds to sleep, new deadline).
+    """
+    now = time.monotonic()
+    if interval_seconds <= 0:
+        return 0.0, now
+    deadline += interval_seconds
+    if deadline < now:
+        deadline += ((now - deadline) // interval_seconds + 1) * interval_seconds
+    return deadline - now, deadline
@@ -1,17 +1,38 @@
 import time
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import psycopg2
+import numpy as np
 from psycopg2 import sql
 from datetime import datetime
 import sys
 import os
 import csv
+
+# orjson is optional: parses the response bytes directly, falls back to stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from utilities.db_utils import get_connection, release_connection, ensure_table_exists, insert_market_data
+from utilities.poll_utils import next_tick
 
 # Constants
 GAMMA_API_BASE_URL = "https://gamma-api.polymarket.com"
 
+# Shared session for all monitor threads: keep-alive to the Gamma API, 429/5xx retried
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset(["GET"]), raise_on_status=False),
+    pool_connections=4,
+    pool_maxsize=16,
+))
+
 # def get_schema_from_slug(slug: str) -> str:
 #     slug = slug.lower()
 #     if slug.startswith("kxhigh"):
@@ -38,9 +59,9 @@ def get_event_by_slug(slug):
     }
 
     try:
-        response = requests.get(url, params=params)
+        response = _SESSION.get(url, params=params)
         if response.status_code == 200:
-            events = response.json()
+            events = _json_loads(response.content)
             if events and len(events) > 0:
                 return events[0]
             else:
@@ -55,27 +76,25 @@ def get_event_by_slug(slug):
 
 def extract_markets_data(event_data):
     markets = event_data.get('markets', [])
-    markets_data = []
-
-    for market in markets:
-        question = market.get('question')
-        best_bid = market.get('bestBid')
-        best_ask = market.get('bestAsk')
-
-        if (best_bid is None or best_ask is None) and 'lastTradePrice' in market:
-            last_price = market.get('lastTradePrice')
-            if best_bid is None:
-                best_bid = last_price
-            if best_ask is None:
-                best_ask = last_price
-
-        markets_data.append({
-            'question': question,
-            'best_bid': best_bid,
-            'best_ask': best_ask
-        })
-
-    return markets_data
+    if not markets:
+        return []
+
+    # Price columns as floats (None -> NaN); missing bid/ask falls back to lastTradePrice
+    bids = np.array([m.get('bestBid') for m in markets], dtype=np.float64)
+    asks = np.array([m.get('bestAsk') for m in markets], dtype=np.float64)
+    last = np.array([m.get('lastTradePrice') for m in markets], dtype=np.float64)
+    bids = np.where(np.isnan(bids), last, bids)
+    asks = np.where(np.isnan(asks), last, asks)
+
+    # NaN -> None so the DB gets NULL
+    return [
+        {
+            'question': m.get('question'),
+            'best_bid': None if b != b else b,
+            'best_ask': None if a != a else a
+        }
+        for m, b, a in zip(markets, bids.tolist(), asks.tolist())
+    ]
 
 # Helper Utilities
 def is_market_active(event_data):
@@ -114,12 +133,16 @@ def monitor_market(slug, event_data, interval_seconds=60):
             ensure_table_exists(conn, slug)
             print(f"Monitoring: {slug} | Title: {event_data.get('title')}")
 
+            deadline = time.monotonic()
             while True:
                 timestamp = datetime.now()
+                timestamp_str = timestamp.isoformat()  # formatted once per poll for all log lines
+                # Always fetch fresh: after a DB error this poll's quotes are already in
+                # local_backup, so reusing the event on reconnect would store them twice.
                 event_data = get_event_by_slug(slug)
 
                 if not event_data or not is_market_active(event_data):
-                    print(f"{timestamp.isoformat()} | Market {slug} closed or not found. Stopping monitoring.")
+                    print(f"{timestamp_str} | Market {slug} closed or not found. Stopping monitoring.")
                     break
 
                 markets_data = extract_markets_data(event_data)
@@ -127,23 +150,24 @@ def monitor_market(slug, event_data, interval_seconds=60):
                 if markets_data:
                     try:
                         insert_market_data(conn, slug, timestamp, markets_data)
-                        print(f"{timestamp.isoformat()} | Inserted {len(markets_data)} markets.")
+                        print(f"{timestamp_str} | Inserted {len(markets_data)} markets.")
 
                     except psycopg2.OperationalError as e:
-                        print(f"{timestamp.isoformat()} | Database connection lost: {e}")
-                        print(f"{timestamp.isoformat()} | Saving data locally instead...")
+                        print(f"{timestamp_str} | Database connection lost: {e}")
+                        print(f"{timestamp_str} | Saving data locally instead...")
                         save_market_data_locally(slug, timestamp, markets_data)
-                        print(f"{timestamp.isoformat()} | Data saved to local backup.")
+                        print(f"{timestamp_str} | Data saved to local backup.")
                         print(f"Retrying connection in 10 seconds...")
                         time.sleep(10)
                         break  # Exit the inner loop to reconnect
 
                     except Exception as e:
-                        print(f"{timestamp.isoformat()} | Unexpected error: {e}")
-                        print(f"{timestamp.isoformat()} | Saving data locally just in case...")
+                        print(f"{timestamp_str} | Unexpected error: {e}")
+                        print(f"{timestamp_str} | Saving data locally just in case...")
                         save_market_data_locally(slug, timestamp, markets_data)
 
-                time.sleep(interval_seconds)
+                sleep_for, deadline = next_tick(deadline, interval_seconds)
+                time.sleep(sleep_for)
 
         except Exception as e:
             print(f"[ERROR] Unexpected error in monitor_market: {e}")
@@ -1,50 +1,84 @@
 import time
 import json
 from datetime import datetime
-from apify_client import ApifyClient
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Initialize the ApifyClient with your API token
-client = ApifyClient("apify_api_gCjYow167TvvxpePpgvRRUe3hjsK7T2uFtjX")  # Replace with your actual API token
+# orjson is optional: parses the response bytes directly, falls back to stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-# Prepare the Actor input
-run_input = {
-    "slug": ["what-price-will-bitcoin-hit-in-april"],
-    "active": True,
-    "archived": False,
-    "closed": False
-}
+GAMMA_API_BASE_URL = "https://gamma-api.polymarket.com"
+
+# Events to poll (by slug)
+SLUGS = ["what-price-will-bitcoin-hit-in-april"]
+
+# (connect, read) timeouts, so a stalled connection can't hang the poller
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Keep-alive session for the Gamma API, 429/5xx retried with backoff
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset(["GET"]), raise_on_status=False),
+))
+
+def _as_list(value):
+    """Gamma returns outcomes/outcomePrices as JSON-encoded strings."""
+    if isinstance(value, str):
+        try:
+            return _json_loads(value)
+        except ValueError:
+            return []
+    return value or []
+
+def _fmt(value):
+    try:
+        return f"{float(value):<8.4f}"
+    except (TypeError, ValueError):
+        return f"{'N/A':<8}"
 
 def fetch_market_data():
     """Fetch market data and print detailed information for each outcome."""
-    # Run the Actor and wait for it to finish
-    run = client.actor("louisdeconinck/polymarket-events-scraper").call(run_input=run_input)
-
-    # Fetch and process Actor results
-    for item in client.dataset(run["defaultDatasetId"]).iterate_items():
-        market_id = item.get("id")
-        market_title = item.get("title")
-        timestamp = datetime.utcnow().isoformat()
-        
-        print(f"\n{timestamp} | Market: {market_title} (ID: {market_id})")
-        
-        # Check if outcomes data exists and process it
-        outcomes = item.get("outcomes", [])
-        if outcomes:
-            print(f"{'Outcome':<30} | {'Probability':<12} | {'Price':<8} | {'Bid':<8} | {'Ask':<8}")
-            print("-" * 80)
-            
-            for outcome in outcomes:
-                outcome_name = outcome.get("name", "Unknown")
-                probability = outcome.get("probability", "N/A")
-                price = outcome.get("price", "N/A")
-                bid = outcome.get("bid", "N/A")
-                ask = outcome.get("ask", "N/A")
-                
-                print(f"{outcome_name:<30} | {probability:<12.4f} | {price:<8.4f} | {bid:<8.4f} | {ask:<8.4f}")
-        else:
-            # Debug: Print the entire item to see its structure
-            print("No outcomes found. Raw item structure:")
-            print(json.dumps(item, indent=2))
+    for slug in SLUGS:
+        try:
+            response = _SESSION.get(f"{GAMMA_API_BASE_URL}/events", params={"slug": slug, "archived": False},
+                                    timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            print(f"Error fetching event {slug}: {e}")
+            continue
+        if response.status_code != 200:
+            print(f"Error fetching event {slug}: {response.status_code}")
+            continue
+
+        for event in _json_loads(response.content):
+            for market in event.get("markets", []):
+                market_id = market.get("id")
+                market_title = market.get("question")
+                timestamp = datetime.utcnow().isoformat()
+
+                print(f"\n{timestamp} | Market: {market_title} (ID: {market_id})")
+
+                outcomes = _as_list(market.get("outcomes"))
+                prices = _as_list(market.get("outcomePrices"))
+                if outcomes:
+                    print(f"{'Outcome':<30} | {'Price':<8} | {'Bid':<8} | {'Ask':<8}")
+                    print("-" * 64)
+
+                    # bestBid/bestAsk are quoted on the first outcome's book
+                    for i, outcome_name in enumerate(outcomes):
+                        price = prices[i] if i < len(prices) else None
+                        bid = market.get("bestBid") if i == 0 else None
+                        ask = market.get("bestAsk") if i == 0 else None
+                        print(f"{outcome_name:<30} | {_fmt(price)} | {_fmt(bid)} | {_fmt(ask)}")
+                else:
+                    # Debug: Print the entire item to see its structure
+                    print("No outcomes found. Raw item structure:")
+                    print(json.dumps(market, indent=2))
 
 if __name__ == "__main__":
     try:
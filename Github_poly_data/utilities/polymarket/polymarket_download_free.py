@@ -1,14 +1,451 @@
+import os
 import time
 import json
+import sys
+import ssl
+import socket
+import random
+import asyncio
+import hashlib
+import functools
+import threading
+from operator import itemgetter
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPSConnection
+from urllib3.connectionpool import HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util import connection as urllib3_connection
+from urllib3.util.retry import Retry
 from datetime import datetime
 
+# orjson is optional: parses the response bytes directly, falls back to stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+# httpx (with the h2 extra) is optional: when present Gamma requests go over
+# HTTP/2 (compressed headers, one multiplexed connection); otherwise requests/HTTP/1.1
+try:
+    import httpx
+    import h2  # noqa: F401  (required by httpx for http2=True)
+except ImportError:
+    httpx = None
+
+# brotli is optional: if either binding is installed, advertise br compression
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+# aiohttp is optional: only needed for the asyncio monitor (monitor_events)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 # Gamma API base URL
 GAMMA_API_BASE_URL = "https://gamma-api.polymarket.com"
 
+# CLOB market channel: pushes book / price_change updates per outcome token
+CLOB_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+
+# (connect, read) timeouts for every Gamma request
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Retry policy for 429/5xx responses
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_BACKOFF_JITTER = 0.3
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+
+# Gamma's addresses are resolved once and reused for DNS_CACHE_TTL seconds by this
+# module's requests session (see _DNSCachingHTTPSConnection), so reconnecting after
+# a dropped keep-alive skips getaddrinfo. The HTTP/2 client keeps one multiplexed
+# connection open and resolves only when it has to reconnect.
+DNS_CACHE_TTL = 600
+_DNS_CACHE = {}  # (host, port) -> (expires_at, [sockaddr, ...])
+
+def _cached_create_connection(address, *args, **kwargs):
+    """
+    urllib3 create_connection with the host lookup memoized for DNS_CACHE_TTL
+    seconds. TLS still verifies against the hostname.
+    """
+    host, port = address
+    entry = _DNS_CACHE.get(address)
+    if entry is None or time.monotonic() >= entry[0]:
+        addresses = [info[4][:2] for info in socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)]
+        entry = (time.monotonic() + DNS_CACHE_TTL, addresses)
+        _DNS_CACHE[address] = entry
+    
+    error = None
+    for sockaddr in entry[1]:
+        try:
+            return urllib3_connection.create_connection(sockaddr, *args, **kwargs)
+        except OSError as e:
+            error = e
+    _DNS_CACHE.pop(address, None)  # all cached addresses failed: re-resolve next time
+    raise error
+
+class _DNSCachingHTTPSConnection(HTTPSConnection):
+    """
+    HTTPSConnection that opens its socket through _cached_create_connection.
+    Overrides _new_conn, the hook urllib3's own SOCKSConnection uses, so the cache
+    applies only to pools built by _ResumingTLSAdapter, not urllib3 process-wide.
+    """
+    def _new_conn(self):
+        try:
+            return _cached_create_connection(
+                (self.host, self.port),
+                self.timeout,
+                source_address=self.source_address,
+                socket_options=self.socket_options,
+            )
+        except socket.timeout as e:
+            raise ConnectTimeoutError(
+                self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})"
+            ) from e
+        except OSError as e:
+            raise NewConnectionError(self, f"Failed to establish a new connection: {e}") from e
+
+class _DNSCachingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _DNSCachingHTTPSConnection
+
+class _ResumingSSLContext(ssl.SSLContext):
+    """
+    SSLContext that keeps the last ticket-bearing TLS session per hostname and
+    offers it on the next handshake, so a reconnect after a dropped keep-alive
+    resumes (abbreviated handshake) instead of doing a full one. Python only
+    resumes when a session is passed to wrap_socket, which urllib3/httpcore
+    never do on their own. TLS 1.3 tickets arrive after the handshake, so they
+    are picked up by _remember_tls_session once a response has been read.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._sessions = {}
+    
+    def remember_session(self, ssl_sock):
+        session = ssl_sock.session
+        if session is not None and session.has_ticket and ssl_sock.server_hostname:
+            self._sessions[ssl_sock.server_hostname] = session
+    
+    def wrap_socket(self, sock, *args, server_hostname=None, session=None, **kwargs):
+        if session is None and server_hostname is not None:
+            session = self._sessions.get(server_hostname)
+        ssl_sock = super().wrap_socket(sock, *args, server_hostname=server_hostname, session=session, **kwargs)
+        self.remember_session(ssl_sock)
+        return ssl_sock
+
+def _resuming_tls_context():
+    """
+    Verifying client context (certifi bundle if installed) with session tickets on
+    """
+    ctx = _ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ctx.options &= ~ssl.OP_NO_TICKET
+    try:
+        import certifi
+        ctx.load_verify_locations(certifi.where())
+    except ImportError:
+        ctx.load_default_certs()
+    return ctx
+
+def _remember_tls_session(response, *args, **kwargs):
+    """
+    Response hook for both clients: by the time response headers are in, any
+    session ticket has been received, so store it on the connection's context
+    """
+    try:
+        if httpx is not None and isinstance(response, httpx.Response):
+            stream = response.extensions.get("network_stream")
+            ssl_sock = stream.get_extra_info("ssl_object") if stream is not None else None
+        else:
+            ssl_sock = getattr(getattr(response.raw, "connection", None), "sock", None)
+        # requests gives an ssl.SSLSocket, httpcore the underlying _ssl socket;
+        # both expose session/context/server_hostname
+        context = getattr(ssl_sock, "context", None)
+        if isinstance(context, _ResumingSSLContext):
+            context.remember_session(ssl_sock)
+    except (AttributeError, OSError, ValueError):
+        pass  # best effort: worst case the next reconnect does a full handshake
+
+class _ResumingTLSAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose pool manager uses a _ResumingSSLContext and opens HTTPS
+    connections through the DNS cache
+    """
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = _resuming_tls_context()
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            **self.poolmanager.pool_classes_by_scheme,
+            "https": _DNSCachingHTTPSConnectionPool,
+        }
+
+# Set to False to stay on requests/HTTP/1.1 even when httpx[http2] is installed
+USE_HTTP2 = True
+
+# Probe cached URLs with HEAD and skip the GET when ETag/Last-Modified match. Off
+# by default: a conditional GET already gets a bodiless 304 in one round trip; this
+# helps only when Gamma reports validators but ignores If-None-Match.
+HEAD_PROBE = False
+
+_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+    "User-Agent": "polymarket-monitor/1.0",
+}
+
+# One keep-alive session for all Gamma calls, so the TLS connection stays warm
+# between polls; 429/5xx and connection errors are retried with jittered backoff,
+# honouring Retry-After.
+_RETRY_KWARGS = dict(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF_FACTOR,
+                     status_forcelist=list(RETRY_STATUS_FORCELIST),
+                     allowed_methods=frozenset(["GET", "HEAD"]),
+                     respect_retry_after_header=True, raise_on_status=False)
+try:
+    _RETRY = Retry(backoff_jitter=RETRY_BACKOFF_JITTER, **_RETRY_KWARGS)
+except TypeError:  # urllib3 < 2 has no backoff_jitter
+    _RETRY = Retry(**_RETRY_KWARGS)
+
+_SESSION = requests.Session()
+_SESSION.mount("https://", _ResumingTLSAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=_RETRY,
+))
+_SESSION.headers.update({**_HEADERS, "Connection": "keep-alive"})
+_SESSION.hooks["response"].append(_remember_tls_session)
+
+# HTTP/2 client, created on first use. Its TLS context outlives close() so a
+# recreated client can still resume the previous sessions.
+_CLIENT = None
+_CLIENT_TLS_CONTEXT = None
+_CLIENT_LOCK = threading.Lock()
+
+def _http2_client():
+    global _CLIENT, _CLIENT_TLS_CONTEXT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            if _CLIENT_TLS_CONTEXT is None:
+                _CLIENT_TLS_CONTEXT = _resuming_tls_context()
+            _CLIENT = httpx.Client(
+                http2=True,
+                verify=_CLIENT_TLS_CONTEXT,
+                event_hooks={"response": [_remember_tls_session]},
+                timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+                headers=_HEADERS,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return _CLIENT
+
+# Terminal request/decode failures the fetchers report and recover from; anything
+# else is a bug and propagates
+_HTTP_ERRORS = (requests.RequestException, ValueError)
+if httpx is not None:
+    _HTTP_ERRORS += (httpx.HTTPError,)
+
+def _retry_delay(attempt, response=None):
+    """
+    Seconds to wait before retry number attempt + 1: the server's Retry-After
+    if it sent one, else exponential backoff plus jitter
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return int(retry_after)
+    return RETRY_BACKOFF_FACTOR * (2 ** attempt) + random.uniform(0, RETRY_BACKOFF_JITTER)
+
+def _http_request(method, url, headers=None):
+    """
+    One Gamma GET/HEAD, over HTTP/2 when available. The requests session retries
+    in its adapter; httpx has no status retries, so the same policy runs here.
+    """
+    if httpx is None or not USE_HTTP2:
+        return _SESSION.request(method, url, headers=headers, timeout=REQUEST_TIMEOUT)
+    client = _http2_client()
+    for attempt in range(RETRY_TOTAL + 1):
+        try:
+            response = client.request(method, url, headers=headers)
+        except httpx.TransportError:
+            if attempt == RETRY_TOTAL:
+                raise
+            time.sleep(_retry_delay(attempt))
+            continue
+        if response.status_code not in RETRY_STATUS_FORCELIST or attempt == RETRY_TOTAL:
+            return response
+        time.sleep(_retry_delay(attempt, response))
+
+# Worker threads for per-slug fan-out (get_events_concurrently); I/O bound, so
+# the GIL is released while each request waits on the socket
+_POOL = ThreadPoolExecutor(max_workers=8)
+
+def close():
+    """
+    Close the shared HTTP session/client and their pooled connections
+    """
+    global _CLIENT
+    _SESSION.close()
+    with _CLIENT_LOCK:
+        if _CLIENT is not None:
+            _CLIENT.close()
+            _CLIENT = None
+
+# Conditional-request state per full request URL: validators from the last 200,
+# plus (blake2b digest, decoded JSON) of its body so unchanged polls skip decoding.
+_etag_by_url = {}
+_lastmod_by_url = {}
+_body_by_url = {}
+
+@functools.lru_cache(maxsize=256)
+def _encoded_url(url, params):
+    """
+    Full request URL for url + params (a tuple of pairs), built once: polling
+    loops ask for the same few URLs every tick, so the encoding is memoized
+    """
+    return requests.Request("GET", url, params=list(params)).prepare().url
+
+def _head_unchanged(full_url):
+    """
+    HEAD the URL and report whether its ETag/Last-Modified still match the
+    validators stored from the last GET (False if there are none to compare)
+    """
+    etag, lastmod = _etag_by_url.get(full_url), _lastmod_by_url.get(full_url)
+    if etag is None and lastmod is None:
+        return False
+    try:
+        response = _http_request("HEAD", full_url)
+    except _HTTP_ERRORS:
+        return False
+    if response.status_code != 200:
+        return False
+    return (etag is None or response.headers.get("ETag") == etag) and \
+           (lastmod is None or response.headers.get("Last-Modified") == lastmod)
+
+def _get_json(url, params):
+    """
+    GET a Gamma endpoint and decode its JSON body, revalidating with
+    If-None-Match / If-Modified-Since. Returns (status_code, data); a 304 or a
+    byte-identical body hands back the previously decoded payload.
+    """
+    full_url = _encoded_url(url, tuple(params.items() if isinstance(params, dict) else params))
+    cached = _body_by_url.get(full_url)
+    if HEAD_PROBE and cached is not None and _head_unchanged(full_url):
+        return 200, cached[1]
+    
+    # Only revalidate when there is a decoded body to fall back on for a 304
+    headers = {}
+    if cached is not None:
+        if full_url in _etag_by_url:
+            headers["If-None-Match"] = _etag_by_url[full_url]
+        if full_url in _lastmod_by_url:
+            headers["If-Modified-Since"] = _lastmod_by_url[full_url]
+    
+    response = _http_request("GET", full_url, headers=headers)
+    if response.status_code == 304 and cached is not None:
+        return 200, cached[1]
+    if response.status_code != 200:
+        return response.status_code, None
+    
+    digest = hashlib.blake2b(response.content, digest_size=16).digest()
+    if cached is not None and cached[0] == digest:
+        data = cached[1]
+    else:
+        data = _json_loads(response.content)
+        _body_by_url[full_url] = (digest, data)
+    
+    # Validators are stored only once the body they describe has been decoded and
+    # cached, so a bad body can't leave us sending If-None-Match with nothing to reuse
+    for store, header in ((_etag_by_url, "ETag"), (_lastmod_by_url, "Last-Modified")):
+        value = response.headers.get(header)
+        if value:
+            store[full_url] = value
+        else:
+            store.pop(full_url, None)
+    return 200, data
+
+# TTL cache for Gamma GETs: key -> (expires_at, value). Duplicate calls within a
+# poll (or across quick restarts, if PERSIST_CACHE is on) skip the network.
+CACHE_TTL = 30
+PERSIST_CACHE = False
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+def _cache_path(key):
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+def _load_cached(key):
+    """
+    Read a persisted entry back into _CACHE if it is still fresh
+    """
+    try:
+        with open(_cache_path(key)) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    remaining = entry["expires_at"] - time.time()
+    if remaining <= 0:
+        return None
+    _CACHE[key] = (time.monotonic() + remaining, entry["value"])
+    return entry["value"]
+
+def _store_cached(key, value, ttl):
+    _CACHE[key] = (time.monotonic() + ttl, value)
+    if PERSIST_CACHE:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(_cache_path(key), "w") as f:
+                json.dump({"expires_at": time.time() + ttl, "value": value}, f)
+        except OSError as e:
+            print(f"Could not persist cache entry: {e}")
+
+def ttl_cached(fn):
+    """
+    Cache a fetcher's non-empty results for CACHE_TTL seconds, keyed by the
+    function and its arguments. Callers can pass ttl=... (0 disables it).
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, ttl=None, **kwargs):
+        ttl = CACHE_TTL if ttl is None else ttl
+        if ttl <= 0:
+            return fn(*args, **kwargs)
+        key = json.dumps([fn.__name__, args, sorted(kwargs.items())], default=str)
+        with _CACHE_LOCK:
+            entry = _CACHE.get(key)
+            if entry and time.monotonic() < entry[0]:
+                return entry[1]
+            if PERSIST_CACHE:
+                value = _load_cached(key)
+                if value is not None:
+                    return value
+        value = fn(*args, **kwargs)
+        if value:
+            with _CACHE_LOCK:
+                _store_cached(key, value, ttl)
+        return value
+    return wrapper
+
+def poll_ttl(interval_seconds):
+    """
+    Cache TTL for a polling loop: half the interval, off for fast polls
+    """
+    return 0 if interval_seconds < 10 else interval_seconds / 2
+
 # Configure which events to track by slug
 EVENT_SLUG = "what-price-will-bitcoin-hit-in-april"
 
+@ttl_cached
 def get_event_by_slug(slug):
     """
     Fetch event data by its slug from the Gamma API
@@ -22,21 +459,53 @@ def get_event_by_slug(slug):
     }
     
     try:
-        response = requests.get(url, params=params)
-        if response.status_code == 200:
-            events = response.json()
+        status_code, events = _get_json(url, params)
+        if status_code == 200:
             if events and len(events) > 0:
                 return events[0]
             else:
                 print(f"No events found with slug: {slug}")
                 return None
         else:
-            print(f"Error fetching event data: {response.status_code}")
+            print(f"Error fetching event data: {status_code}")
             return None
-    except Exception as e:
+    except _HTTP_ERRORS as e:
         print(f"Exception while fetching event data: {str(e)}")
         return None
 
+@ttl_cached
+def get_events_by_slugs(slugs):
+    """
+    Fetch several events in one Gamma request (repeated slug= params).
+    Returns {slug: event}; slugs with no live event are left out.
+    """
+    url = f"{GAMMA_API_BASE_URL}/events"
+    params = [("slug", s) for s in slugs] + [
+        ("active", "true"),
+        ("archived", "false"),
+        ("closed", "false"),
+    ]
+    
+    try:
+        status_code, events = _get_json(url, params)
+        if status_code == 200:
+            return {event.get("slug"): event for event in events or []}
+        else:
+            print(f"Error fetching event data: {status_code}")
+            return {}
+    except _HTTP_ERRORS as e:
+        print(f"Exception while fetching event data: {str(e)}")
+        return {}
+
+def get_events_concurrently(slugs, ttl=None):
+    """
+    Fetch each slug with its own request, run in parallel on the thread pool.
+    Returns {slug: event or None}. Use when slugs can't be batched into one
+    /events call (see monitor_event(batch=False)).
+    """
+    return dict(zip(slugs, _POOL.map(lambda slug: get_event_by_slug(slug, ttl=ttl), slugs)))
+
+@ttl_cached
 def fetch_all_events(active=True, limit=10, offset=0):
     """
     Fetch all events with optional filtering
@@ -49,13 +518,13 @@ def fetch_all_events(active=True, limit=10, offset=0):
     }
     
     try:
-        response = requests.get(url, params=params)
-        if response.status_code == 200:
-            return response.json()
+        status_code, events = _get_json(url, params)
+        if status_code == 200:
+            return events
         else:
-            print(f"Error fetching all events: {response.status_code}")
+            print(f"Error fetching all events: {status_code}")
             return []
-    except Exception as e:
+    except _HTTP_ERRORS as e:
         print(f"Exception while fetching all events: {str(e)}")
         return []
 
@@ -74,65 +543,313 @@ def print_available_events(limit=5):
             print(f"   {i+1}.{j+1}. Market: {market.get('question')}")
     print("========================\n")
 
-def extract_markets_data(event_data):
-    """
-    Extract all markets data from an event, including bids and asks
-    """
-    markets = event_data.get('markets', [])
-    markets_data = []
+# C-level lookup of the quoted fields; markets missing one take the .get() path
+_QUOTE_FIELDS = itemgetter('question', 'bestBid', 'bestAsk')
+
+def _market_quote(market):
+    try:
+        question, best_bid, best_ask = _QUOTE_FIELDS(market)
+    except KeyError:
+        question, best_bid, best_ask = market.get('question'), market.get('bestBid'), market.get('bestAsk')
     
-    for market in markets:
-        question = market.get('question')
-        best_bid = market.get('bestBid')
-        best_ask = market.get('bestAsk')
-        
-        # Fallback to lastTradePrice if bid/ask not available
-        if (best_bid is None or best_ask is None) and 'lastTradePrice' in market:
-            last_price = market.get('lastTradePrice')
+    # Fallback to lastTradePrice if bid/ask not available
+    if best_bid is None or best_ask is None:
+        last_price = market.get('lastTradePrice')
+        if last_price is not None:
             if best_bid is None:
                 best_bid = last_price
             if best_ask is None:
                 best_ask = last_price
-        
-        markets_data.append({
-            'question': question,
-            'best_bid': best_bid,
-            'best_ask': best_ask
-        })
     
-    return markets_data
+    return question, best_bid, best_ask
 
-def monitor_event(slug, interval_seconds=60):
+def extract_markets_data(event_data):
     """
-    Continuously monitor an event and all its markets by slug
+    Extract all markets data from an event, including bids and asks, as
+    (question, best_bid, best_ask) tuples
     """
-    print(f"Starting to monitor event with slug: {slug}")
+    return [_market_quote(market) for market in event_data.get('markets', [])]
+
+def extract_token_ids(event_data):
+    """
+    (question, clob_token_ids) per market; the first token is the "Yes" outcome.
+    Gamma sends the ids JSON-encoded, so they are only decoded when needed here.
+    """
+    tokens = []
+    for market in event_data.get('markets', []):
+        token_ids = market.get('clobTokenIds') or []
+        if isinstance(token_ids, str):
+            try:
+                token_ids = _json_loads(token_ids)
+            except ValueError:
+                token_ids = []
+        tokens.append((market.get('question'), token_ids))
+    return tokens
+
+_RULE = "-" * 50
+
+def _write(text):
+    """
+    One stdout write + flush for a whole block of output
+    """
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+def format_event_snapshot(timestamp, slug, event_data, markets_data=None):
+    """
+    Format one poll's worth of market data for an event as a single string
+    (markets_data can be passed in if the caller already extracted it)
+    """
+    if not event_data:
+        return f"{timestamp} | Could not fetch event data for slug: {slug}\n"
+    
+    buf = [f"\n{timestamp} | Event: {event_data.get('title')}"]
+    if markets_data is None:
+        markets_data = extract_markets_data(event_data)
+    if markets_data:
+        for question, best_bid, best_ask in markets_data:
+            buf.append(f"Market: {question}")
+            buf.append(f"Best Bid: {best_bid} | Best Ask: {best_ask}")
+            buf.append(_RULE)
+    else:
+        buf.append("No markets found in this event")
+    buf.append("")
+    return "\n".join(buf)
+
+def print_event_snapshot(timestamp, slug, event_data):
+    """
+    Print one poll's worth of market data for an event
+    """
+    _write(format_event_snapshot(timestamp, slug, event_data))
+
+# How often (seconds) monitor_event flushes its buffered NDJSON output
+NDJSON_FLUSH_SECONDS = 30
+
+def monitor_event(slugs, interval_seconds=60, batch=True, max_interval_seconds=600, idle_ticks=3,
+                  ndjson_path=None, deltas_only=True):
+    """
+    Continuously monitor one or more events (a slug or a list of slugs) and all
+    their markets; every tick is a single batched /events request, or with
+    batch=False one request per slug fetched concurrently.
+    
+    The interval adapts: after idle_ticks polls with no bid/ask change it doubles
+    per quiet poll, up to max_interval_seconds, and drops back to interval_seconds
+    on the first change. Pass max_interval_seconds=interval_seconds for a fixed rate.
+    
+    With deltas_only (the default) each tick emits only the markets whose bid/ask
+    changed since they were last emitted (everything on an event's first poll);
+    pass deltas_only=False to reprint every market each tick.
+    
+    With ndjson_path, nothing is printed per tick; instead one JSON line
+    ({"ts", "slug", "event", "markets": [[question, bid, ask], ...]}) is appended
+    for each event whose quotes changed, flushed every NDJSON_FLUSH_SECONDS.
+    """
+    if isinstance(slugs, str):
+        slugs = [slugs]
+    print(f"Starting to monitor event with slug: {', '.join(slugs)}")
     print(f"Checking every {interval_seconds} seconds")
     print("Press Ctrl+C to stop monitoring\n")
     
+    # The loop runs for the life of the process: resolve globals/attributes once
+    # here so each tick uses fast local lookups
+    ttl = poll_ttl(interval_seconds)
+    if batch or len(slugs) == 1:
+        fetch = functools.partial(get_events_by_slugs, slugs, ttl=ttl)
+    else:
+        fetch = functools.partial(get_events_concurrently, slugs, ttl=ttl)
+    _now = datetime.utcnow
+    _sleep = time.sleep
+    _monotonic = time.monotonic
+    _extract = extract_markets_data
+    _format = format_event_snapshot
+    _dumps = _json_dumps
+    
+    log = open(ndjson_path, "ab", buffering=1 << 16) if ndjson_path else None
+    last_flush = _monotonic()
+    prev_snapshot = {}
+    prev_quotes = {}  # (slug, question) -> (best_bid, best_ask) last emitted
+    misses = 0
+    sleep_seconds = interval_seconds
     try:
         while True:
-            timestamp = datetime.utcnow().isoformat()
-            event_data = get_event_by_slug(slug)
+            timestamp = _now().isoformat()
+            events = fetch()
+            markets_by_slug = {slug: _extract(events[slug])
+                               for slug in slugs if events.get(slug)}
+            snapshot = {slug: tuple(markets_data) for slug, markets_data in markets_by_slug.items()}
             
-            if event_data:
-                event_title = event_data.get('title')
-                print(f"\n{timestamp} | Event: {event_title}")
-                
-                markets_data = extract_markets_data(event_data)
-                if markets_data:
-                    for market in markets_data:
-                        print(f"Market: {market['question']}")
-                        print(f"Best Bid: {market['best_bid']} | Best Ask: {market['best_ask']}")
-                        print("-" * 50)
-                else:
-                    print("No markets found in this event")
+            # slug -> rows to emit this tick
+            if deltas_only:
+                changed = {}
+                for slug, markets_data in markets_by_slug.items():
+                    rows = [row for row in markets_data if prev_quotes.get((slug, row[0])) != row[1:]]
+                    if rows or slug not in prev_snapshot:
+                        changed[slug] = rows
+                    for question, best_bid, best_ask in rows:
+                        prev_quotes[(slug, question)] = (best_bid, best_ask)
             else:
-                print(f"{timestamp} | Could not fetch event data for slug: {slug}")
+                changed = {slug: markets_data for slug, markets_data in markets_by_slug.items()
+                           if log is None or prev_snapshot.get(slug) != snapshot[slug]}
             
-            time.sleep(interval_seconds)
+            if log is None:
+                # Fetch failures are always reported; live events only when they have rows
+                _write("".join(_format(timestamp, slug, events.get(slug), changed.get(slug))
+                               for slug in slugs if slug in changed or not events.get(slug)))
+            else:
+                for slug, rows in changed.items():
+                    log.write(_dumps({"ts": timestamp, "slug": slug,
+                                      "event": events[slug].get('title'),
+                                      "markets": rows}) + b"\n")
+                if _monotonic() - last_flush >= NDJSON_FLUSH_SECONDS:
+                    log.flush()
+                    last_flush = _monotonic()
+            
+            if snapshot == prev_snapshot:
+                misses += 1
+                if misses >= idle_ticks:
+                    sleep_seconds = min(max_interval_seconds,
+                                        interval_seconds * 2 ** min(misses - idle_ticks + 1, 6))
+            else:
+                misses = 0
+                sleep_seconds = interval_seconds
+            prev_snapshot = snapshot
+            
+            _sleep(sleep_seconds)
     except KeyboardInterrupt:
         print("\nStopping event monitoring...")
+        close()
+    finally:
+        if log is not None:
+            log.close()
+
+async def _fetch_event(session, slug):
+    """
+    aiohttp version of get_event_by_slug, for monitor_events
+    """
+    url = f"{GAMMA_API_BASE_URL}/events"
+    params = {
+        "slug": slug,
+        "active": "true",
+        "archived": "false",
+        "closed": "false"
+    }
+    
+    try:
+        async with session.get(url, params=params) as response:
+            if response.status == 200:
+                events = _json_loads(await response.read())
+                if events and len(events) > 0:
+                    return events[0]
+                print(f"No events found with slug: {slug}")
+                return None
+            print(f"Error fetching event data: {response.status}")
+            return None
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        print(f"Exception while fetching event data: {str(e)}")
+        return None
+
+async def monitor_events(slugs, interval_seconds=60):
+    """
+    Monitor several events concurrently: each tick fetches all slugs at once over
+    one persistent aiohttp session, then prints them in order. Requires aiohttp.
+    """
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is required for monitor_events: pip install aiohttp")
+
+    print(f"Starting to monitor events: {', '.join(slugs)}")
+    print(f"Checking every {interval_seconds} seconds")
+    
+    connector = aiohttp.TCPConnector(limit=20, keepalive_timeout=75,
+                                     use_dns_cache=True, ttl_dns_cache=DNS_CACHE_TTL)
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                     headers={"Accept": "application/json"}) as session:
+        while True:
+            timestamp = datetime.utcnow().isoformat()
+            events = await asyncio.gather(*(_fetch_event(session, slug) for slug in slugs))
+            _write("".join(format_event_snapshot(timestamp, slug, event_data)
+                           for slug, event_data in zip(slugs, events)))
+            await asyncio.sleep(interval_seconds)
+
+def _best_price(levels, pick):
+    prices = [float(level["price"]) for level in levels or []]
+    return pick(prices) if prices else None
+
+def _handle_ws_message(raw, quotes, labels):
+    """
+    Apply one market-channel message to quotes ({token_id: (bid, ask)}) and print
+    every market whose best bid/ask changed
+    """
+    try:
+        payload = _json_loads(raw)
+    except ValueError:
+        return  # PONG and other non-JSON keepalives
+    
+    buf = []
+    for event in payload if isinstance(payload, list) else [payload]:
+        event_type = event.get("event_type")
+        if event_type == "book":
+            updates = [(event.get("asset_id"),
+                        _best_price(event.get("bids"), max),
+                        _best_price(event.get("asks"), min))]
+        elif event_type == "price_change":
+            updates = [(change.get("asset_id"), change.get("best_bid"), change.get("best_ask"))
+                       for change in event.get("price_changes", [])]
+        else:
+            continue
+        
+        for asset_id, best_bid, best_ask in updates:
+            if asset_id not in labels or quotes.get(asset_id) == (best_bid, best_ask):
+                continue
+            quotes[asset_id] = (best_bid, best_ask)
+            buf.append(f"\n{datetime.utcnow().isoformat()} | Market: {labels[asset_id]}\n"
+                       f"Best Bid: {best_bid} | Best Ask: {best_ask}\n{_RULE}\n")
+    if buf:
+        _write("".join(buf))
+
+async def monitor_event_ws(token_ids, slug=None, max_backoff=60):
+    """
+    Push-based monitor: subscribe to the CLOB market channel for token_ids and
+    print a market whenever its best bid/ask changes. Reconnects with exponential
+    backoff; if slug is given, markets are labelled by question and a REST
+    snapshot is printed while the socket is down. Requires aiohttp.
+    """
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is required for monitor_event_ws: pip install aiohttp")
+    
+    token_ids = [str(token_id) for token_id in token_ids]
+    labels = {token_id: token_id for token_id in token_ids}
+    if slug:
+        event_data = await asyncio.to_thread(get_event_by_slug, slug, ttl=0)
+        for question, market_tokens in extract_token_ids(event_data or {}):
+            for token_id in market_tokens[:1]:
+                if token_id in labels:
+                    labels[token_id] = question
+    
+    quotes = {}
+    backoff = 1
+    print(f"Subscribing to {len(token_ids)} tokens on {CLOB_WS_URL}")
+    connector = aiohttp.TCPConnector(use_dns_cache=True, ttl_dns_cache=DNS_CACHE_TTL)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        while True:
+            try:
+                async with session.ws_connect(CLOB_WS_URL, heartbeat=20) as ws:
+                    await ws.send_json({"type": "market", "assets_ids": token_ids})
+                    backoff = 1
+                    async for msg in ws:
+                        if msg.type == aiohttp.WSMsgType.TEXT:
+                            _handle_ws_message(msg.data, quotes, labels)
+                        elif msg.type == aiohttp.WSMsgType.ERROR:
+                            break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"WebSocket error: {str(e)}")
+            
+            print(f"WebSocket disconnected, reconnecting in {backoff}s")
+            if slug:
+                event_data = await asyncio.to_thread(get_event_by_slug, slug, ttl=0)
+                print_event_snapshot(datetime.utcnow().isoformat(), slug, event_data)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, max_backoff)
 
 def main():
     """
@@ -141,6 +858,27 @@ def main():
     # Show some available events to help user find the right slug
     print_available_events()
     
+    # --ws <slug>: follow the event's order books over the CLOB WebSocket
+    if len(sys.argv) > 1 and sys.argv[1] == "--ws":
+        slug = sys.argv[2] if len(sys.argv) > 2 else EVENT_SLUG
+        event_data = get_event_by_slug(slug)
+        token_ids = [market_tokens[0] for _, market_tokens in extract_token_ids(event_data or {})
+                     if market_tokens]
+        if not token_ids:
+            print(f"No CLOB tokens found for slug: {slug}")
+            return
+        try:
+            asyncio.run(monitor_event_ws(token_ids, slug))
+        except KeyboardInterrupt:
+            print("\nStopping event monitoring...")
+        return
+
+    # Several slugs on the command line: one batched request per tick, with the
+    # same delta output and adaptive interval as a single slug
+    if len(sys.argv) > 2:
+        monitor_event(sys.argv[1:], batch=True)
+        return
+
     # If EVENT_SLUG is provided, start monitoring it
     if EVENT_SLUG:
         monitor_event(EVENT_SLUG)